@@ -1,9 +1,8 @@
 import os
 import cv2
 import numpy as np
-import pytesseract # Yeni import
-from PIL import Image # Yeni import (Tesseract ile daha iyi çalışır)
 from datetime import datetime # Zaman damgası için yeni import
+from engines import get_saliency, get_ocr # Saliency/OCR worker başına bir kez yüklenir
 
 # --- Yeni: CTA Anahtar Kelime Listesi (Genişletilebilir) ---
 CTA_KEYWORDS = [
@@ -100,6 +99,8 @@ def _find_cta_candidates(img, min_area_ratio=0.0003, aspect_ratio_range=(0.3, 12
 # --- Yeni: Adayları OCR ile Filtreleyen Fonksiyon (Teşhis Printi Hala İçinde) ---
 def _filter_candidates_with_ocr(img, candidates):
     """Aday kutuları içindeki metni okuyarak CTA anahtar kelimesi içerip içermediğini kontrol eder."""
+    from PIL import Image # Tesseract ile daha iyi çalışır; sadece OCR yapan süreçte yüklenir
+    pytesseract = get_ocr()
     confirmed_ctas = []
     h, w, _ = img.shape
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
@@ -153,8 +154,7 @@ def analyze(image_path, out_dir):
     if img is None: raise ValueError("Görsel okunamadı.")
     h_orig, w_orig, _ = img.shape
 
-    sal_instance = cv2.saliency.StaticSaliencySpectralResidual_create()
-    ok, sal_f = sal_instance.computeSaliency(img)
+    ok, sal_f = get_saliency().computeSaliency(img)
     if not ok: raise RuntimeError("Saliency üretilemedi.")
     sal_u8 = (sal_f * 255).astype("uint8")
     if sal_u8.shape[:2] != img.shape[:2]:
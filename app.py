@@ -1,18 +1,16 @@
 import os
 import cv2
 import numpy as np
-import matplotlib
-import datetime
 import logging
+import time
 from io import BytesIO
-from PIL import Image as PillowImage
-import pytesseract
 import secrets
 from flask import Flask, render_template, request, url_for, redirect, session
 from werkzeug.utils import secure_filename
 
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+# Ağır modüller (matplotlib, pytesseract) ve saliency nesneleri engines.py üzerinden
+# ilk ihtiyaçta yüklenir ve worker başına yeniden kullanılır.
+from engines import get_saliency, get_ocr, get_figure
 
 # --- Konfigürasyon ---
 UPLOAD_FOLDER = 'static/uploads'
@@ -49,8 +47,7 @@ def to_gray(img):
 
 # --- Analiz Fonksiyonları ---
 def generate_heatmap(img, output_path):
-    saliency = cv2.saliency.StaticSaliencySpectralResidual_create()
-    success, saliency_map = saliency.computeSaliency(img)
+    success, saliency_map = get_saliency().computeSaliency(img)
     if not success or saliency_map is None: saliency_map = np.zeros(img.shape[:2], dtype=np.uint8)
     saliency_map_norm = cv2.normalize(saliency_map, None, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
     heatmap = cv2.applyColorMap(saliency_map_norm, cv2.COLORMAP_JET)
@@ -106,6 +103,7 @@ def generate_gaze_plot(img, attn_map, output_path):
 
 # --- EN GELİŞMİŞ VE NİHAİ CTA FONKSİYONU ---
 def score_button_candidates(img, attn_map):
+    pytesseract = get_ocr()
     gray = to_gray(img); img_h, img_w = img.shape[:2]
     CTA_KEYWORDS = ['satın al', 'sepete ekle', 'hemen al', 'sipariş ver', 'teklif al', 'kayıt ol', 'üye ol', 'giriş yap', 'başvur', 'incele', 'keşfet', 'sorgula', 'devamı', 'daha fazla', 'bilgi al', 'tümünü gör', 'buy now', 'add to cart', 'shop now', 'sign up', 'register', 'login', 'learn more', 'read more', 'discover', 'explore', 'get started', 'altyapı sorgula', 'contact us', 'detaylı incele']
     ACTION_VERBS = ['al', 'ekle', 'ver', 'ol', 'yap', 'başvur', 'incele', 'keşfet', 'sorgula', 'gör', 'tıkla', 'başla', 'izle', 'dinle', 'buy', 'add', 'shop', 'sign', 'register', 'login', 'learn', 'read', 'discover', 'explore', 'get', 'watch', 'listen']
@@ -258,36 +256,37 @@ TEXT_COLOR = '#e0e0e0'; GRID_COLOR = '#4a4a5e'; PRIMARY_COLOR = '#3a7bd5'
 FACE_COLOR = '#1a1a2e'; BAR_COLORS = ['#28a745', '#ffc107', '#17a2b8', '#dc3545']
 def generate_bar_chart(scores, output_path):
     labels = ['Görünürlük', 'Odaklanma', 'Denge', 'CTA Etkisi']; values = [scores.get(k, 0) for k in ['visibility', 'focus', 'balanced', 'cta']]
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor=FACE_COLOR); ax.set_facecolor(FACE_COLOR)
+    fig, ax = get_figure('bar', figsize=(8, 5), facecolor=FACE_COLOR); ax.set_facecolor(FACE_COLOR)
     ax.bar(labels, values, color=BAR_COLORS); ax.set_ylabel('Skor (0-100)', color=TEXT_COLOR)
     ax.set_title('Metrik Skor Dağılımı', color=TEXT_COLOR, pad=20); ax.set_ylim(0, 100)
     ax.tick_params(axis='x', colors=TEXT_COLOR); ax.tick_params(axis='y', colors=TEXT_COLOR)
     ax.grid(axis='y', linestyle='--', alpha=0.5, color=GRID_COLOR)
     for spine in ['top', 'right', 'left', 'bottom']: ax.spines[spine].set_color(GRID_COLOR)
-    plt.tight_layout(); plt.savefig(output_path, facecolor=FACE_COLOR); plt.close(fig)
+    fig.tight_layout(); fig.savefig(output_path, facecolor=FACE_COLOR)
 def generate_radar_chart(scores, output_path):
     labels = np.array(['Görünürlük', 'Odaklanma', 'Denge', 'CTA Etkisi']); stats = np.array([scores.get(k, 0) for k in ['visibility', 'focus', 'balanced', 'cta']])
     angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
     stats = np.concatenate((stats, [stats[0]])); angles += angles[:1]
-    fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True), facecolor=FACE_COLOR)
+    fig, ax = get_figure('radar', figsize=(6, 6), facecolor=FACE_COLOR, subplot_kw=dict(polar=True))
     ax.set_facecolor(FACE_COLOR); ax.fill(angles, stats, color=PRIMARY_COLOR, alpha=0.4)
     ax.plot(angles, stats, color=PRIMARY_COLOR, linewidth=2); ax.set_yticklabels([])
     ax.set_thetagrids(np.degrees(angles[:-1]), labels, color=TEXT_COLOR, fontsize=12)
-    ax.spines['polar'].set_color(GRID_COLOR); plt.savefig(output_path, facecolor=FACE_COLOR); plt.close(fig)
+    ax.spines['polar'].set_color(GRID_COLOR); fig.savefig(output_path, facecolor=FACE_COLOR)
 def generate_timeline_chart(video_results, output_path):
     timestamps = [r['timestamp'] for r in video_results]; visibility = [r['scores']['visibility'] for r in video_results]
     focus = [r['scores']['focus'] for r in video_results]; cta = [r['scores']['cta'] for r in video_results]
-    fig, ax = plt.subplots(figsize=(12, 6), facecolor=FACE_COLOR); ax.set_facecolor(FACE_COLOR)
+    fig, ax = get_figure('timeline', figsize=(12, 6), facecolor=FACE_COLOR); ax.set_facecolor(FACE_COLOR)
     ax.plot(timestamps, visibility, marker='o', linestyle='-', label='Görünürlük')
     ax.plot(timestamps, focus, marker='o', linestyle='-', label='Odaklanma')
     ax.plot(timestamps, cta, marker='o', linestyle='-', label='CTA Etkisi')
     ax.set_title('Video Boyunca Skorların Değişimi', color=TEXT_COLOR, pad=20)
     ax.set_xlabel('Zaman (Saniye)', color=TEXT_COLOR); ax.set_ylabel('Skor (0-100)', color=TEXT_COLOR)
-    legend = ax.legend(facecolor=FACE_COLOR, edgecolor=GRID_COLOR); plt.setp(legend.get_texts(), color=TEXT_COLOR)
+    legend = ax.legend(facecolor=FACE_COLOR, edgecolor=GRID_COLOR)
+    for text in legend.get_texts(): text.set_color(TEXT_COLOR)
     ax.grid(True, linestyle='--', alpha=0.5, color=GRID_COLOR); ax.tick_params(axis='x', colors=TEXT_COLOR)
     ax.tick_params(axis='y', colors=TEXT_COLOR)
     for spine in ['top', 'right', 'left', 'bottom']: ax.spines[spine].set_color(GRID_COLOR)
-    ax.set_ylim(0, 105); plt.tight_layout(); plt.savefig(output_path, facecolor=FACE_COLOR); plt.close(fig)
+    ax.set_ylim(0, 105); fig.tight_layout(); fig.savefig(output_path, facecolor=FACE_COLOR)
 
 def perform_analysis(filepath, filename):
     original_img = load_image(filepath)
@@ -347,6 +346,20 @@ def process_video(video_path, filename_prefix):
         previous_frame_gray = current_frame_gray
     cap.release(); return results_list
 
+def warm_up():
+    """Saliency, OCR ve grafik şablonlarını önceden yükler; deploy sonrası ilk istek yavaş kalmaz."""
+    start = time.perf_counter()
+    sample = np.full((120, 320, 3), 255, dtype=np.uint8)
+    cv2.rectangle(sample, (60, 40), (260, 80), (0, 120, 255), -1)
+    cv2.putText(sample, 'Satin Al', (100, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
+    get_saliency().computeSaliency(sample)
+    try: get_ocr().image_to_string(sample, lang='tur+eng', config='--psm 7')
+    except Exception as e: logging.warning(f"Isınma sırasında OCR çalıştırılamadı: {e}")
+    scores = {'visibility': 50, 'focus': 50, 'balanced': 50, 'cta': 50}
+    generate_bar_chart(scores, BytesIO()); generate_radar_chart(scores, BytesIO())
+    generate_timeline_chart([{'timestamp': 0, 'scores': scores}, {'timestamp': 2, 'scores': scores}], BytesIO())
+    logging.info(f"Isınma tamamlandı ({time.perf_counter() - start:.2f} sn).")
+
 def cleanup_files(filename_or_id):
     try:
         session.pop('results', None); session.pop('video_results', None)
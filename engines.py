@@ -0,0 +1,39 @@
+import threading
+
+# --- Worker Başına Yeniden Kullanılan Motorlar ---
+# Saliency nesneleri ve grafik figürleri her istekte yeniden oluşturulmaz; her iş
+# parçacığı kendi kopyasını bir kez oluşturup tekrar kullanır. Gunicorn `preload_app`
+# ile master süreçte ısıtılan nesneler fork sonrası worker'lara copy-on-write ile geçer.
+_local = threading.local()
+
+def _cache():
+    cache = getattr(_local, 'cache', None)
+    if cache is None:
+        cache = _local.cache = {}
+    return cache
+
+def get_saliency():
+    """Spectral Residual saliency nesnesini döndürür (iş parçacığı başına tek örnek)."""
+    cache = _cache()
+    if 'saliency' not in cache:
+        import cv2
+        cache['saliency'] = cv2.saliency.StaticSaliencySpectralResidual_create()
+    return cache['saliency']
+
+def get_ocr():
+    """pytesseract modülünü ilk ihtiyaçta içe aktarır."""
+    import pytesseract
+    return pytesseract
+
+def get_figure(name, figsize, facecolor, subplot_kw=None):
+    """Verilen isimdeki grafik şablonunu (fig, ax) döndürür; eksen her çağrıda temizlenir."""
+    cache = _cache()
+    key = ('figure', name)
+    if key not in cache:
+        # pyplot yerine doğrudan Figure: global durum yok, matplotlib sadece grafik çizen süreçte yüklenir.
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize, facecolor=facecolor)
+        cache[key] = (fig, fig.subplots(subplot_kw=subplot_kw))
+    fig, ax = cache[key]
+    ax.clear()
+    return fig, ax
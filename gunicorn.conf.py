@@ -0,0 +1,21 @@
+import os
+
+# --- Üretim Sunucusu (Gunicorn) Ayarları ---
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+worker_class = 'sync'
+# Video analizi uzun sürebilir; worker'ın erken öldürülmemesi için geniş zaman aşımı.
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '300'))
+# Bellek sızıntılarına karşı worker'ları belirli istek sayısından sonra yenile.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '200'))
+max_requests_jitter = 20
+
+# Uygulama master süreçte bir kez yüklenir ve ısıtılır; fork edilen worker'lar modülleri,
+# saliency nesnelerini ve grafik şablonlarını copy-on-write ile devralır. Ayrıca
+# app.secret_key tüm worker'larda aynı kalır, böylece oturumlar worker'lar arasında geçerlidir.
+preload_app = True
+accesslog = '-'
+
+def when_ready(server):
+    from app import warm_up
+    warm_up()